@@ -11,10 +11,18 @@ Workflow:
 """
 
 import os
+import re
+import stat
+import json
+import time
+import functools
+import operator
 import sys
 import shutil
+import threading
 import traceback
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 import nuke
 
@@ -41,6 +49,27 @@ sg = None
 engine = None
 context = None
 
+# Folder sizes are stat-latency bound on network storage; cap the pool so we don't flood the mount
+SIZE_WORKERS = 16
+# Default number of parallel cross-device copies (adjustable in the dialog);
+# a few parallel copies overlap network I/O
+MOVE_WORKERS = 8
+# Versions are fetched from ShotGrid in pages of this size
+VERSION_PAGE_SIZE = 500
+# Newest versions kept per status by the cleanup rules; older ones are moved
+KEEP_NEWEST = {"na": 0, "innote": 1, "note": 2}
+RULE_LABELS = {"na": "Rule 1 (na)", "innote": "Rule 2 (older innote)", "note": "Rule 3 (older note)"}
+# Seconds a project's fetched versions are reused in memory between scans
+VERSIONS_CACHE_TTL = 300
+# Last scan result, reused while ShotGrid reports no version changes
+SCAN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".sg_render_cleanup_cache.json")
+# A cached scan younger than this (seconds) is shown when the dialog opens
+SCAN_CACHE_MAX_AGE = 3600
+# Above this many folders a scan turns "Compute sizes" off for the next run
+SIZE_PREVIEW_LIMIT = 500
+# Seconds to wait for a filer root to answer before treating it as offline
+ROOT_PROBE_TIMEOUT = 2.0
+
 def setup_logger():
     log = logging.getLogger("sg_render_cleanup")
     log.setLevel(logging.INFO)
@@ -53,6 +82,331 @@ def setup_logger():
 
 log = setup_logger()
 
+def _allocated_size(st):
+    """
+    Bytes actually allocated on disk for a stat result.
+    st_blocks is in 512-byte units on POSIX and reflects sparse/compressed files
+    (ZFS etc.); Windows has no st_blocks, so fall back to the logical st_size.
+    """
+    blocks = getattr(st, 'st_blocks', None)
+    if blocks is None:
+        return st.st_size
+    return blocks * 512
+
+def _dir_size(path):
+    """
+    Return the total size in bytes of all files under path.
+    Walks with an explicit stack of os.scandir calls; DirEntry type checks come from
+    the directory listing, so each file costs a single stat() (its size).
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            total += _allocated_size(entry.stat(follow_symlinks=False))
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
+
+# (bit_length threshold, unit, divisor) from largest to smallest
+_UNITS = ((40, "TB", 1 << 40), (30, "GB", 1 << 30), (20, "MB", 1 << 20), (10, "KB", 1 << 10))
+
+def _fmt_bytes(b):
+    """Format a byte count for display, picking the unit from its bit length"""
+    bl = b.bit_length()
+    for shift, name, div in _UNITS:
+        if bl > shift:
+            return f"{b / div:.2f} {name}"
+    return f"{b} bytes"
+
+@functools.lru_cache(maxsize=None)
+def _seq_dir(frame_path):
+    """Memoized os.path.dirname; versions of one sequence share the same frame path pattern"""
+    return os.path.dirname(frame_path)
+
+def _path_root(path):
+    """
+    Return the mount-level root of path: the drive or UNC share on Windows,
+    otherwise the first two components (e.g. /mnt/renders).
+    """
+    drive, rest = os.path.splitdrive(path)
+    if drive:
+        return drive + os.sep
+    parts = [p for p in rest.split(os.sep) if p]
+    return os.sep + os.sep.join(parts[:2])
+
+def _estimate_dir_size(path):
+    """
+    Estimate the size of a sequence folder without a stat() per frame.
+    EXR frames are counted from the directory listing and sized from the first and
+    last frame (by name); any other entries are sized exactly.
+    """
+    total = 0
+    frames = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        total += _dir_size(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if entry.name[-4:].lower() == '.exr':
+                            frames.append(entry)
+                        else:
+                            total += _allocated_size(entry.stat(follow_symlinks=False))
+                except OSError:
+                    pass
+    except OSError:
+        return total
+
+    if len(frames) > 2:
+        frames.sort(key=lambda e: e.name)
+        samples = (frames[0], frames[-1])
+    else:
+        samples = frames
+    sizes = []
+    for entry in samples:
+        try:
+            sizes.append(_allocated_size(entry.stat(follow_symlinks=False)))
+        except OSError:
+            pass
+    if sizes:
+        total += int(sum(sizes) / len(sizes) * len(frames))
+    return total
+
+def _path_exists(path):
+    """Existence-only stand-in for _path_size: 0 if path exists, None if it doesn't"""
+    try:
+        os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
+        return 0  # exists but can't be read
+    return 0
+
+def _path_size(path, approximate=False):
+    """
+    Return the size in bytes of a file or folder, or None if it doesn't exist.
+    The one stat() that tells files from folders doubles as the existence check.
+    With approximate=True, sequence folders are estimated by _estimate_dir_size.
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
+        return 0  # exists but can't be read; best-effort size
+    if stat.S_ISDIR(st.st_mode):
+        if approximate:
+            return _estimate_dir_size(path)
+        return _dir_size(path)
+    return _allocated_size(st)
+
+class ScanWorker(QtCore.QObject, QtCore.QRunnable):
+    """
+    Runs the ShotGrid query, cleanup rules and size calculation off the Qt main thread.
+    Results are reported back through queued signals so the dialog stays responsive.
+    """
+    progress = QtCore.Signal(int, str)
+    finished = QtCore.Signal(list, object)
+    failed = QtCore.Signal(str, str)
+
+    def __init__(self, cleanup, project, refresh=False):
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        self.setAutoDelete(False)  # RenderCleanup keeps the reference until the scan reports back
+        self.cleanup = cleanup
+        self.project = project
+        self.refresh = refresh  # ignore cached scan results and versions
+
+    def run(self):
+        cleanup = self.cleanup
+        try:
+            # Shotgun instances aren't thread-safe; tk-core hands out one per thread, so
+            # take this thread's connection rather than the one the dialog thread uses
+            sg = cleanup.context.sgtk.shotgun
+            self.progress.emit(5, "Checking for changes since last scan...")
+            digest = cleanup._scan_digest(sg, self.project)
+            if self.refresh:
+                cleanup._versions_cache.pop(self.project['id'], None)
+                cleanup._live_roots.clear()
+            else:
+                cached = cleanup._load_scan_cache(self.project, digest)
+                if cached is not None:
+                    cleanup.log_message("No versions changed since the last scan; using cached results.")
+                    self.finished.emit(*cached)
+                    return
+
+            self.progress.emit(10, "Fetching and grouping versions by shot/task...")
+            cleanup.log_message(f"Fetching versions for project: {self.project['name']}")
+
+            # Versions arrive page by page and are grouped as they stream in. The digest
+            # already holds the server-side count, so the bar can move 10-60% per page.
+            expected = int(digest['id']) if digest and digest.get('id', '').isdigit() else 0
+
+            def page_fetched(fetched):
+                pct = 10 + int(min(fetched, expected) / expected * 50) if expected else 10
+                self.progress.emit(pct, f"Fetched {fetched} versions...")
+
+            task_versions = cleanup.group_versions_by_shot(
+                cleanup.get_versions_for_cleanup(self.project, digest, on_page=page_fetched)
+            )
+            cleanup.log_message(f"Found {sum(len(v) for v in task_versions.values())} versions to analyze")
+
+            self.progress.emit(60, "Applying cleanup rules...")
+            candidates = cleanup.apply_cleanup_rules(task_versions)
+
+            self.progress.emit(90, "Finalizing results...")
+
+            # An offline filer would make every stat below hang until the mount times out,
+            # so probe each root once and treat everything under a dead one as missing.
+            root_alive = cleanup._probe_roots(candidates)
+            reachable = [p for p in candidates if root_alive[_path_root(p)]]
+            for root in sorted(r for r, alive in root_alive.items() if not alive):
+                cleanup.log_message(f"WARNING: {root} is not reachable; skipping folders on it")
+            unreachable_paths = len(candidates) - len(reachable)
+            candidates = reachable
+            total = len(candidates)
+
+            # Size each candidate (best-effort), one worker per folder. The same
+            # traversal is the existence check, so each folder is only visited once.
+            # With sizes off, only that existence check (one stat) is left.
+            if cleanup.compute_sizes:
+                check = functools.partial(_path_size, approximate=cleanup.approximate_size)
+                step = "Calculating size"
+            else:
+                check = _path_exists
+                step = "Checking folder"
+            sizes = {}
+            with ThreadPoolExecutor(max_workers=SIZE_WORKERS) as executor:
+                futures = {executor.submit(check, p): p for p in candidates}
+                # Report progress in completion order so one slow folder doesn't stall the bar
+                for i, future in enumerate(as_completed(futures), start=1):
+                    sizes[futures[future]] = future.result()
+                    self.progress.emit(90 + int(i / total * 9), f"{step} {i} of {total}")
+
+            paths_to_move = [(p, sizes[p]) for p in candidates if sizes[p] is not None]
+            missing_paths = total - len(paths_to_move)
+            if missing_paths > 0:
+                cleanup.log_message(f"\nSkipped {missing_paths} paths that no longer exist on the file system")
+            if unreachable_paths > 0:
+                cleanup.log_message(f"Skipped {unreachable_paths} paths on unreachable file systems")
+            total_size_bytes = sum(size for _, size in paths_to_move) if cleanup.compute_sizes else None
+
+            # A scan that couldn't see a filer is incomplete; don't let it mask that filer later
+            if unreachable_paths == 0:
+                cleanup._save_scan_cache(self.project, digest, paths_to_move, total_size_bytes)
+            self.finished.emit(paths_to_move, total_size_bytes)
+
+        except Exception as e:
+            self.failed.emit(f"Error during scan: {str(e)}", traceback.format_exc())
+
+class MoveWorker(QtCore.QObject, QtCore.QRunnable):
+    """
+    Moves the scanned sequence folders into dest_root off the Qt main thread.
+    Progress and the result are reported through queued signals, like ScanWorker.
+    """
+    progress = QtCore.Signal(int, str)
+    finished = QtCore.Signal(list, int)
+    failed = QtCore.Signal(str, str)
+
+    def __init__(self, cleanup, paths, dest_root, threads):
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        self.setAutoDelete(False)  # RenderCleanup keeps the reference until the move reports back
+        self.cleanup = cleanup
+        self.paths = list(paths)  # (sequence directory, size) snapshot from the last scan
+        self.dest_root = dest_root
+        self.threads = threads  # parallel cross-device copies
+
+    def run(self):
+        cleanup = self.cleanup
+        dest_root = self.dest_root
+        try:
+            # Same-device moves are a cheap rename; cross-device moves copy the
+            # whole sequence, so run those on a pool to overlap network I/O.
+            dest_dev = os.stat(dest_root).st_dev
+            total = len(self.paths)
+            moved = {}
+            # Index the destination once; collisions are then resolved without a stat per probe
+            with os.scandir(dest_root) as it:
+                existing = set(os.path.normcase(e.name) for e in it)
+            cross_device = []
+            done = 0
+            # The scan doesn't re-check folders later; anything gone by now is found here
+            missing_paths = 0
+            for i, (seq_dir, _) in enumerate(self.paths):
+                try:
+                    src_dev = os.stat(seq_dir).st_dev
+                except FileNotFoundError:
+                    cleanup.log_message(f"Path not found (skipping): {seq_dir}")
+                    missing_paths += 1
+                    done += 1
+                    continue
+                except OSError as stat_err:
+                    # Permission/stale-handle/timeout on one folder must not abort the rest
+                    cleanup.log_message(f"Cannot access (skipping): {seq_dir}: {stat_err}")
+                    missing_paths += 1
+                    done += 1
+                    continue
+
+                base_name = os.path.basename(seq_dir.rstrip(os.sep))
+                dest_path = cleanup._ensure_unique_dest(dest_root, base_name, existing)
+                # The index can miss names on case-insensitive shares (normcase is a no-op
+                # on POSIX) or folders created since; shutil.move would nest into those
+                while os.path.lexists(dest_path):
+                    dest_path = cleanup._ensure_unique_dest(dest_root, base_name, existing)
+
+                if src_dev != dest_dev:
+                    cross_device.append((i, seq_dir, dest_path))
+                    continue
+
+                done += 1
+                self.progress.emit(int(done / total * 100), f"Moving folder {done} of {total}")
+                try:
+                    cleanup.log_message(f"Moving: {seq_dir}  ->  {dest_path}")
+                    shutil.move(seq_dir, dest_path)
+                    moved[i] = dest_path
+                except FileNotFoundError:
+                    cleanup.log_message(f"Path not found (skipping): {seq_dir}")
+                    missing_paths += 1
+                except Exception as move_err:
+                    cleanup.log_message(f"Move failed for {seq_dir}: {move_err}")
+
+            if cross_device:
+                cleanup.log_message(f"Copying {len(cross_device)} folders across devices...")
+                with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                    futures = {}
+                    for i, seq_dir, dest_path in cross_device:
+                        cleanup.log_message(f"Moving: {seq_dir}  ->  {dest_path}")
+                        futures[executor.submit(shutil.move, seq_dir, dest_path)] = (i, seq_dir, dest_path)
+                    for future in as_completed(futures):
+                        i, seq_dir, dest_path = futures[future]
+                        done += 1
+                        self.progress.emit(int(done / total * 100), f"Moving folder {done} of {total}")
+                        try:
+                            future.result()
+                            moved[i] = dest_path
+                        except FileNotFoundError:
+                            cleanup.log_message(f"Path not found (skipping): {seq_dir}")
+                            missing_paths += 1
+                        except Exception as move_err:
+                            cleanup.log_message(f"Move failed for {seq_dir}: {move_err}")
+
+            # Keep moved_paths in scan order regardless of completion order
+            self.finished.emit([moved[i] for i in sorted(moved)], missing_paths)
+
+        except Exception as e:
+            self.failed.emit(f"Error during move: {str(e)}", traceback.format_exc())
+
 class RenderCleanup(object):
     def __init__(self):
         self.dialog = None
@@ -60,10 +414,19 @@ class RenderCleanup(object):
         self.progress_bar = None
         self.status_label = None
         self.scan_button = None
+        self.refresh_checkbox = None
+        self.size_checkbox = None
         self.move_button = None
+        self.move_threads_spin = None
 
         self.moved_paths = []
-        self.paths_to_move = []
+        self.paths_to_move = []  # (sequence directory, size in bytes)
+        self._scan_worker = None
+        self._move_worker = None
+        self._versions_cache = {}  # project id -> (timestamp, digest, versions)
+        self._live_roots = set()  # path roots that answered a probe this session (see _probe_roots)
+        self._log_buffer = deque()
+        self._log_timer = None
 
         try:
             import sgtk
@@ -83,6 +446,30 @@ class RenderCleanup(object):
             self.log.info("Successfully initialized ShotGrid connection")
 
             self.excluded_pipeline_steps = ["Roto", "Paint", "Prep", "Ingest", "v000"]
+            # Version statuses the cleanup rules act on (the ShotGrid query only returns
+            # these); derived from KEEP_NEWEST so a new rule can't be filtered out server-side
+            self.cleanup_statuses = list(KEEP_NEWEST)
+            # Only the Version fields the scan reads; linked entities come back as
+            # type/id/name stubs and step filtering is server-side, so no deep links
+            self.version_fields = [
+                'code',
+                'sg_status_list',
+                'entity',
+                'sg_task',
+                'sg_path_to_frames',
+                'created_at'
+            ]
+            # Estimate sequence sizes from frame count x sampled frame size instead of
+            # stat()ing every frame; the size shown after a scan is best-effort anyway
+            self.approximate_size = True
+            # Size the folders found by a scan at all (the "Compute sizes" checkbox)
+            self.compute_sizes = True
+            # Defensive second pass: drop versions whose *path* names an excluded step even
+            # though ShotGrid didn't link them to one (mis-linked tasks). Cheap; leave on
+            self.check_excluded_paths = True
+            # Single case-insensitive pass over each path instead of upper()-ing per step
+            self._excluded_re = re.compile("|".join(re.escape(s) for s in self.excluded_pipeline_steps), re.IGNORECASE)
+            self._excluded_names = {s.lower(): s for s in self.excluded_pipeline_steps}
 
         except ImportError as e:
             error_message = f"Could not import ShotGrid Toolkit: {str(e)}"
@@ -133,6 +520,12 @@ class RenderCleanup(object):
                 self.results_text.setReadOnly(True)
                 layout.addWidget(self.results_text)
 
+                # Log lines are buffered and flushed at ~10 Hz instead of one append per line
+                self._log_timer = QtCore.QTimer(self.dialog)
+                self._log_timer.setInterval(100)
+                self._log_timer.timeout.connect(self._flush_log)
+                self._log_timer.start()
+
                 # Buttons
                 button_layout = QtWidgets.QHBoxLayout()
 
@@ -140,16 +533,35 @@ class RenderCleanup(object):
                 self.scan_button.clicked.connect(self.run_scan)
                 button_layout.addWidget(self.scan_button)
 
+                self.refresh_checkbox = QtWidgets.QCheckBox("Refresh")
+                self.refresh_checkbox.setToolTip("Ignore cached scan results and re-query ShotGrid")
+                button_layout.addWidget(self.refresh_checkbox)
+
+                self.size_checkbox = QtWidgets.QCheckBox("Compute sizes")
+                self.size_checkbox.setChecked(self.compute_sizes)
+                self.size_checkbox.setToolTip("Size every folder found (slow on network storage for large scans)")
+                button_layout.addWidget(self.size_checkbox)
+
                 self.move_button = QtWidgets.QPushButton("Move Files")
                 self.move_button.clicked.connect(self.move_files)
                 button_layout.addWidget(self.move_button)
 
+                # Parallel copies used for folders on a different filesystem than the destination
+                button_layout.addWidget(QtWidgets.QLabel("Copy threads:"))
+                self.move_threads_spin = QtWidgets.QSpinBox()
+                self.move_threads_spin.setRange(1, 32)
+                self.move_threads_spin.setValue(MOVE_WORKERS)
+                self.move_threads_spin.setToolTip("Number of folders copied at once when moving across filesystems")
+                button_layout.addWidget(self.move_threads_spin)
+
                 close_button = QtWidgets.QPushButton("Close")
                 close_button.clicked.connect(self.dialog.close)
                 button_layout.addWidget(close_button)
 
                 layout.addLayout(button_layout)
 
+                self._restore_cached_scan()
+
             if hasattr(self.dialog, "exec"):
                 self.dialog.exec()
             else:
@@ -161,17 +573,18 @@ class RenderCleanup(object):
             nuke.message(error_msg)
 
     def run_scan(self):
-        """Run the scan to identify folders to move"""
+        """Start the scan to identify folders to move on a background thread"""
         try:
             self.scan_button.setEnabled(False)
+            self.move_button.setEnabled(False)
 
             self.progress_bar.setValue(0)
             self.progress_bar.setVisible(True)
             self.status_label.setText("Starting scan...")
             self.status_label.setVisible(True)
-            QtWidgets.QApplication.processEvents()
 
             if self.results_text:
+                self._log_buffer.clear()
                 self.results_text.clear()
 
             self.log_message("Starting scan...")
@@ -180,76 +593,63 @@ class RenderCleanup(object):
             if not project:
                 self.log_message("Error: No project found in context")
                 self.scan_button.setEnabled(True)
+                self.move_button.setEnabled(True)
                 return
 
-            self.update_progress(10, "Fetching versions...")
-            self.log_message(f"Fetching versions for project: {project['name']}")
-
-            all_versions = self.get_versions_for_cleanup(project)
-            self.log_message(f"Found {len(all_versions)} versions to analyze")
-
-            self.update_progress(40, "Grouping versions by shot/task...")
-            task_versions = self.group_versions_by_shot(all_versions)
-
-            self.update_progress(60, "Applying cleanup rules...")
-            self.paths_to_move = self.apply_cleanup_rules(task_versions)
-
-            self.update_progress(90, "Finalizing results...")
-
-            # Calculate total size (best-effort)
-            total_size_bytes = 0
-            for p in self.paths_to_move:
-                if os.path.exists(p):
-                    if os.path.isdir(p):
-                        for dirpath, _, filenames in os.walk(p):
-                            for f in filenames:
-                                fp = os.path.join(dirpath, f)
-                                if os.path.exists(fp):
-                                    try:
-                                        total_size_bytes += os.path.getsize(fp)
-                                    except Exception:
-                                        pass
-                    else:
-                        try:
-                            total_size_bytes += os.path.getsize(p)
-                        except Exception:
-                            pass
-
-            def _fmt_bytes(b):
-                if b > 1099511627776:
-                    return f"{b / 1099511627776:.2f} TB"
-                if b > 1073741824:
-                    return f"{b / 1073741824:.2f} GB"
-                if b > 1048576:
-                    return f"{b / 1048576:.2f} MB"
-                if b > 1024:
-                    return f"{b / 1024:.2f} KB"
-                return f"{b} bytes"
-
-            if self.paths_to_move:
-                self.log_message("EXR sequence folders identified:")
-                for p in self.paths_to_move:
-                    self.log_message(f"  - {p}")
-            else:
-                self.log_message("No EXR sequence folders found to move.")
+            self.compute_sizes = self.size_checkbox.isChecked()
+            worker = ScanWorker(self, project, refresh=self.refresh_checkbox.isChecked())
+            worker.progress.connect(self.update_progress, QtCore.Qt.QueuedConnection)
+            worker.finished.connect(self._scan_done, QtCore.Qt.QueuedConnection)
+            worker.failed.connect(self._scan_failed, QtCore.Qt.QueuedConnection)
+            self._scan_worker = worker
+            QtCore.QThreadPool.globalInstance().start(worker)
 
-            self.log_message("\n" + "="*50)
-            self.log_message("SCAN SUMMARY:")
-            self.log_message(f"Total folders: {len(self.paths_to_move)}")
-            self.log_message(f"Approximate total size: {_fmt_bytes(total_size_bytes)}")
-            self.log_message("="*50)
+        except Exception as e:
+            self._scan_failed(f"Error during scan: {str(e)}", traceback.format_exc())
 
-            self.update_progress(100, "Scan complete")
-            self.scan_button.setEnabled(True)
+    def _scan_done(self, paths, total_size_bytes):
+        """Report the result of a finished ScanWorker (runs on the main thread)"""
+        self._scan_worker = None
+        self.paths_to_move = paths
 
-        except Exception as e:
-            error_msg = f"Error during scan: {str(e)}"
-            self.log_message(error_msg)
-            self.log_message(traceback.format_exc())
-            nuke.message(error_msg)
-            self.scan_button.setEnabled(True)
-            self.status_label.setText("Error during scan")
-            self.update_progress(100, "Error")
+        if self.paths_to_move:
+            self.log_message("EXR sequence folders identified:")
+            for p, size in self.paths_to_move:
+                if total_size_bytes is None:
+                    self.log_message(f"  - {p}")
+                else:
+                    self.log_message(f"  - {p}  ({_fmt_bytes(size)})")
+        else:
+            self.log_message("No EXR sequence folders found to move.")
+
+        self.log_message("\n" + "="*50)
+        self.log_message("SCAN SUMMARY:")
+        self.log_message(f"Total folders: {len(self.paths_to_move)}")
+        if total_size_bytes is None:
+            self.log_message("Approximate total size: not computed")
+        else:
+            self.log_message(f"Approximate total size: {_fmt_bytes(total_size_bytes)}")
+        self.log_message("="*50)
+
+        if total_size_bytes is not None and len(self.paths_to_move) > SIZE_PREVIEW_LIMIT and self.size_checkbox:
+            self.size_checkbox.setChecked(False)
+            self.log_message(f"More than {SIZE_PREVIEW_LIMIT} folders: 'Compute sizes' turned off for the next scan")
+
+        self.update_progress(100, "Scan complete")
+        self.scan_button.setEnabled(True)
+        self.move_button.setEnabled(True)
+
+    def _scan_failed(self, error_msg, details=""):
+        """Report a scan error (runs on the main thread)"""
+        self._scan_worker = None
+        self.log_message(error_msg)
+        if details:
+            self.log_message(details)
+        nuke.message(error_msg)
+        self.scan_button.setEnabled(True)
+        self.move_button.setEnabled(True)
+        self.status_label.setText("Error during scan")
+        self.update_progress(100, "Error")
 
     def update_progress(self, value, status_text=None):
         """Update the progress bar and status text"""
@@ -258,24 +658,23 @@ class RenderCleanup(object):
                 self.progress_bar.setValue(value)
             if status_text and self.status_label:
                 self.status_label.setText(status_text)
-            QtWidgets.QApplication.processEvents()
         except Exception as e:
             self.log.error(f"Error updating progress: {str(e)}")
 
-    def _ensure_unique_dest(self, dest_root, base_name):
+    def _ensure_unique_dest(self, dest_root, base_name, existing):
         """
         Return a destination path under dest_root that doesn't collide.
-        If 'dest_root/base_name' exists, returns '.../base_name_1', '.../base_name_2', etc.
+        existing is the set of os.path.normcase'd names already in (or reserved under) dest_root.
+        If base_name is taken, returns '.../base_name_1', '.../base_name_2', etc.
+        The chosen name is added to existing so later calls won't reuse it.
         """
-        candidate = os.path.join(dest_root, base_name)
-        if not os.path.exists(candidate):
-            return candidate
+        name = base_name
         idx = 1
-        while True:
-            candidate_i = os.path.join(dest_root, f"{base_name}_{idx}")
-            if not os.path.exists(candidate_i):
-                return candidate_i
+        while os.path.normcase(name) in existing:
+            name = f"{base_name}_{idx}"
             idx += 1
+        existing.add(os.path.normcase(name))
+        return os.path.join(dest_root, name)
 
     def move_files(self):
         """Move the identified EXR sequence directories into a single flat destination folder."""
@@ -304,6 +703,8 @@ class RenderCleanup(object):
                 nuke.message("Please select a valid destination folder.")
                 return
 
+            # A scan would replace paths_to_move under the running move
+            self.scan_button.setEnabled(False)
             self.move_button.setEnabled(False)
             self.progress_bar.setValue(0)
             self.progress_bar.setVisible(True)
@@ -313,188 +714,332 @@ class RenderCleanup(object):
             self.log_message(f"Moving {len(self.paths_to_move)} folders to: {dest_root}")
             self.moved_paths = []
 
-            total = len(self.paths_to_move)
-            for i, seq_dir in enumerate(self.paths_to_move, start=1):
-                progress_value = int((i - 1) / total * 100)
-                self.update_progress(progress_value, f"Moving folder {i} of {total}")
-
-                if not os.path.exists(seq_dir):
-                    self.log_message(f"Path not found (skipping): {seq_dir}")
-                    continue
+            worker = MoveWorker(self, self.paths_to_move, dest_root, self.move_threads_spin.value())
+            worker.progress.connect(self.update_progress, QtCore.Qt.QueuedConnection)
+            worker.finished.connect(self._move_done, QtCore.Qt.QueuedConnection)
+            worker.failed.connect(self._move_failed, QtCore.Qt.QueuedConnection)
+            self._move_worker = worker
+            QtCore.QThreadPool.globalInstance().start(worker)
 
-                base_name = os.path.basename(seq_dir.rstrip(os.sep))
-                dest_path = self._ensure_unique_dest(dest_root, base_name)
-
-                try:
-                    self.log_message(f"Moving: {seq_dir}  ->  {dest_path}")
-                    shutil.move(seq_dir, dest_path)
-                    self.moved_paths.append(dest_path)
-                except Exception as move_err:
-                    self.log_message(f"Move failed for {seq_dir}: {move_err}")
+        except Exception as e:
+            self._move_failed(f"Error during move: {str(e)}", traceback.format_exc())
+
+    def _move_done(self, moved_paths, missing_paths):
+        """Report the result of a finished MoveWorker (runs on the main thread)"""
+        self._move_worker = None
+        self.moved_paths = moved_paths
+        if self.moved_paths:
+            self._clear_scan_cache()
+
+        self.update_progress(100, "Move complete")
+        if missing_paths > 0:
+            self.log_message(f"Skipped {missing_paths} paths that no longer exist or could not be accessed")
+        self.log_message(f"Move complete. Moved {len(self.moved_paths)} of {len(self.paths_to_move)} folders.")
+        self.scan_button.setEnabled(True)
+        self.move_button.setEnabled(True)
+
+    def _move_failed(self, error_msg, details=""):
+        """Report a move error (runs on the main thread)"""
+        self._move_worker = None
+        self._clear_scan_cache()  # some folders may have moved before the error
+        self.log_message(error_msg)
+        if details:
+            self.log_message(details)
+        nuke.message(error_msg)
+        self.scan_button.setEnabled(True)
+        self.move_button.setEnabled(True)
+        self.status_label.setText("Error during move")
+        self.update_progress(100, "Error")
+
+    def _version_filters(self, project):
+        """ShotGrid filters for cleanup candidates in project"""
+        # Step and status exclusions are applied by ShotGrid so only candidates come back
+        return [
+            ['project', 'is', {'type': 'Project', 'id': project['id']}],  # minimal entity payload
+            ['sg_path_to_frames', 'ends_with', '.exr'],  # EXR frames only (also excludes empty paths)
+            ['sg_status_list', 'in', self.cleanup_statuses],
+            ['sg_task.Task.step.Step.code', 'not_in', self.excluded_pipeline_steps]
+        ]
+
+    def _scan_digest(self, sg, project):
+        """
+        Return a cheap fingerprint of the candidate versions in project, or None.
+        Uses one sg.summarize call: any new, edited or removed version changes it.
+        sg must be a connection owned by the calling thread.
+        """
+        try:
+            result = sg.summarize(
+                'Version', self._version_filters(project),
+                [
+                    {'field': 'id', 'type': 'record_count'},
+                    {'field': 'created_at', 'type': 'latest'},
+                    {'field': 'updated_at', 'type': 'latest'},
+                ]
+            )
+            digest = {k: str(v) for k, v in result['summaries'].items()}
+            # Only settings that change which versions are kept; sizing options are
+            # checked against the scan cache entry itself (see _load_scan_cache)
+            digest['settings'] = str((self.excluded_pipeline_steps, self.cleanup_statuses, self.check_excluded_paths))
+            return digest
+        except Exception as e:
+            self.log_message(f"Could not summarize versions (scan cache disabled): {str(e)}")
+            return None
 
-            self.update_progress(100, "Move complete")
-            self.log_message(f"Move complete. Moved {len(self.moved_paths)} of {len(self.paths_to_move)} folders.")
-            self.move_button.setEnabled(True)
+    def _read_scan_cache(self, project):
+        """Return (digest, timestamp, paths, total_size_bytes, approximate_size) cached for project, or None"""
+        try:
+            with open(SCAN_CACHE_PATH) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cache.get('project_id') != project['id']:
+            return None
+        try:
+            paths = [(p, size) for p, size in cache['paths']]
+            return cache['digest'], cache.get('ts', 0), paths, cache['total_size_bytes'], cache.get('approximate_size')
+        except (KeyError, TypeError, ValueError):
+            return None  # written by an older version of the tool
 
-        except Exception as e:
-            error_msg = f"Error during move: {str(e)}"
-            self.log_message(error_msg)
-            self.log_message(traceback.format_exc())
-            nuke.message(error_msg)
-            self.move_button.setEnabled(True)
-            self.status_label.setText("Error during move")
-            self.update_progress(100, "Error")
+    def _load_scan_cache(self, project, digest):
+        """
+        Return the cached (paths, total_size_bytes) for project if digest still matches, else None.
+        A sized entry also satisfies a scan with sizes off; a scan that wants sizes needs
+        an entry sized the same way (approximate or exact).
+        """
+        if digest is None:
+            return None
+        entry = self._read_scan_cache(project)
+        if entry is None or entry[0] != digest:
+            return None
+        _, _, paths, total_size_bytes, approximate = entry
+        if self.compute_sizes and (total_size_bytes is None or approximate != self.approximate_size):
+            return None
+        return paths, total_size_bytes
+
+    def _restore_cached_scan(self):
+        """Show the last scan for the current project if it's recent, so Move works without rescanning"""
+        project = self.context.project
+        entry = self._read_scan_cache(project) if project else None
+        if entry is None:
+            return
+        _, ts, paths, total_size_bytes, _ = entry
+        age = time.time() - ts
+        if age >= SCAN_CACHE_MAX_AGE:
+            return
+        self.log_message(f"Loaded {len(paths)} paths from cache (age: {int(age // 60)}m); click Scan to refresh")
+        self._scan_done(paths, total_size_bytes)
 
-    def get_versions_for_cleanup(self, project):
-        """Get all versions that aren't in excluded pipeline steps and have EXR frames"""
+    def _save_scan_cache(self, project, digest, paths, total_size_bytes):
+        """Atomically write the scan result to SCAN_CACHE_PATH"""
+        if digest is None:
+            return
+        cache = {
+            'project_id': project['id'],
+            'digest': digest,
+            'ts': time.time(),
+            'paths': paths,
+            'total_size_bytes': total_size_bytes,
+            'approximate_size': self.approximate_size,
+        }
+        tmp_path = SCAN_CACHE_PATH + ".tmp"
         try:
-            filters = [
-                ['project', 'is', project],
-                ['sg_path_to_frames', 'is_not', None]  # Ensure path_to_frames exists
-            ]
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, SCAN_CACHE_PATH)
+        except OSError as e:
+            self.log_message(f"Could not write scan cache: {str(e)}")
+
+    def _clear_scan_cache(self):
+        """Drop the scan cache (the file system no longer matches it)"""
+        try:
+            os.remove(SCAN_CACHE_PATH)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.log_message(f"Could not remove scan cache: {str(e)}")
 
-            fields = [
-                'code',
-                'sg_status_list',
-                'entity',
-                'sg_task',
-                'sg_task.Task.step',
-                'sg_path_to_frames',
-                'created_at'
-            ]
+    def _probe_roots(self, paths):
+        """
+        Return {root: reachable} for the roots of paths.
+        Probes run in daemon threads so a hung mount costs ROOT_PROBE_TIMEOUT, not the
+        OS mount timeout; a probe that hasn't answered by then counts as offline.
+        Only roots that answered are remembered, so offline ones are re-probed next scan
+        (a slow automount is not written off for the session).
+        """
+        roots = {_path_root(p) for p in paths}
+        results = {}
+        probes = []
+        for root in roots - self._live_roots:
+            probe = threading.Thread(
+                target=lambda r=root: results.__setitem__(r, os.path.exists(r)), daemon=True
+            )
+            probe.start()
+            probes.append((root, probe))
+
+        deadline = time.monotonic() + ROOT_PROBE_TIMEOUT
+        for root, probe in probes:
+            probe.join(max(0.0, deadline - time.monotonic()))
+            if results.get(root, False):
+                self._live_roots.add(root)
+
+        return {root: root in self._live_roots for root in roots}
+
+    def _iter_versions(self, filters, fields, on_page=None):
+        """
+        Yield Version records from ShotGrid one page at a time (server default id order).
+        The next page is requested on a helper thread while the current one is consumed,
+        so grouping overlaps the network round-trip. The helper queries through its own
+        tk-core connection (one per thread); Shotgun instances aren't thread-safe.
+        on_page, if given, is called with the running record count after each page.
+        """
+        def fetch(page):
+            # Runs on the prefetch thread; tk-core caches this thread's connection
+            sg = self.context.sgtk.shotgun
+            return sg.find(
+                'Version', filters, fields,
+                limit=VERSION_PAGE_SIZE, page=page, retired_only=False
+            )
+
+        page = 1
+        fetched = 0
+        # One page in flight at a time keeps ShotGrid load the same as a serial loop
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            pending = prefetch.submit(fetch, page)
+            while pending is not None:
+                batch = pending.result()
+                # A short page is the last one; otherwise start on the next right away
+                pending = prefetch.submit(fetch, page + 1) if len(batch) == VERSION_PAGE_SIZE else None
+                fetched += len(batch)
+                if on_page is not None:
+                    on_page(fetched)
+                for v in batch:
+                    yield v
+                page += 1
+
+    def get_versions_for_cleanup(self, project, digest=None, on_page=None):
+        """
+        Yield all versions that aren't in excluded pipeline steps and have EXR frames.
+        Versions are streamed page by page so grouping can start before the query finishes.
+        ShotGrid errors propagate to the caller; nothing is cached for a failed fetch.
+        The kept versions are cached per project for VERSIONS_CACHE_TTL seconds and reused
+        while the ShotGrid digest (see _scan_digest) is unchanged.
+        on_page is passed through to _iter_versions for per-page progress.
+        """
+        cached = self._versions_cache.get(project['id'])
+        if cached is not None:
+            ts, cached_digest, versions = cached
+            age = time.time() - ts
+            if cached_digest == digest and age < VERSIONS_CACHE_TTL:
+                self.log_message(f"Using {len(versions)} versions cached {int(age)}s ago")
+                for v in versions:
+                    yield v
+                return
 
-            versions = self.sg.find('Version', filters, fields, order=[{'field_name': 'created_at', 'direction': 'asc'}])
-            self.log_message(f"Retrieved {len(versions)} total versions from ShotGrid")
+        try:
+            filters = self._version_filters(project)
 
-            filtered_versions = []
+            retrieved_count = 0
+            kept = []
             excluded_count = 0
-            non_exr_count = 0
+            # Bound once outside the per-version loop; status, EXR and step
+            # filtering already happened server-side (see _version_filters)
+            search_excluded = self._excluded_re.search if self.check_excluded_paths else None
+            keep_version = kept.append
 
-            for v in versions:
-                version_code = v.get('code', 'Unknown')
-                path = v.get('sg_path_to_frames', 'No path')
+            for v in self._iter_versions(filters, self.version_fields, on_page):
+                retrieved_count += 1
 
-                if not path or not path.lower().endswith('.exr'):
-                    non_exr_count += 1
-                    continue
-
-                if v.get('sg_task') and v.get('sg_task.Task.step'):
-                    step = v['sg_task.Task.step']
-                    step_name = step.get('name', 'Unknown')
-                    if step_name in self.excluded_pipeline_steps:
-                        self.log_message(f"Excluding version {version_code} due to pipeline step: {step_name}")
+                # Extra safeguard: skip if path text contains excluded keywords
+                if search_excluded is not None:
+                    path = v['sg_path_to_frames']
+                    match = search_excluded(path)
+                    if match:
+                        self.log_message(f"WARNING: Path suggests excluded step '{self._excluded_names[match.group(0).lower()]}': {path}")
                         excluded_count += 1
                         continue
 
-                # Extra safeguard: skip if path text contains excluded keywords
-                skip_by_path = False
-                for excluded_step in self.excluded_pipeline_steps:
-                    if excluded_step.upper() in path.upper():
-                        self.log_message(f"WARNING: Path suggests excluded step '{excluded_step}': {path}")
-                        skip_by_path = True
-                        break
-                if skip_by_path:
-                    excluded_count += 1
-                    continue
-
-                filtered_versions.append(v)
+                keep_version(v)
+                yield v
 
-            self.log_message(f"Filter stats: {len(filtered_versions)} kept, {excluded_count} excluded by step/path, {non_exr_count} non-EXR")
-            return filtered_versions
+            self.log_message(f"Retrieved {retrieved_count} total versions from ShotGrid")
+            self.log_message(f"Filter stats: {len(kept)} kept, {excluded_count} excluded by path")
+            self._versions_cache[project['id']] = (time.time(), digest, kept)
 
         except Exception as e:
+            # A partial fetch must fail the scan: the caller would otherwise apply the
+            # rules to, and cache, an incomplete version list
             self.log_message(f"Error retrieving versions: {str(e)}")
-            self.log_message(traceback.format_exc())
-            return []
+            raise
 
     def group_versions_by_shot(self, versions):
-        """Group versions by their shot entity AND task"""
-        task_versions = defaultdict(list)
+        """Group versions by their (shot entity id, task id), each group sorted oldest first"""
+        task_versions = {}
         for version in versions:
-            if version.get('entity') and version.get('sg_task'):
-                key = f"{version['entity']['id']}_{version['sg_task']['id']}"
-                task_versions[key].append(version)
+            entity = version.get('entity')
+            task = version.get('sg_task')
+            if entity and task:
+                task_versions.setdefault((entity['id'], task['id']), []).append(version)
+        # The rules rely on chronological order; sort here rather than trusting the query order
+        by_created = operator.itemgetter('created_at')
+        for bucket in task_versions.values():
+            bucket.sort(key=by_created)
         return task_versions
 
     def get_sequence_directory(self, frame_path):
         """Return the directory containing the frame sequence"""
-        try:
-            return os.path.dirname(frame_path)
-        except Exception as e:
-            self.log_message(f"Error getting sequence directory: {str(e)}")
-            return frame_path
+        return _seq_dir(frame_path)
 
     def apply_cleanup_rules(self, task_versions):
         """
         Return a list of EXR sequence directories to move,
         applying the three rules on a per-(shot,task) basis.
+        Existence is not checked here: ScanWorker drops missing folders while sizing them.
         """
         paths_to_move = []
-        missing_paths = 0
+        seen = set()  # de-duplicate while preserving order
+        # Bound once outside the per-version loop
+        log = self.log_message
+        add_seen = seen.add
+        add_path = paths_to_move.append
+        keep_newest = KEEP_NEWEST.get
 
         try:
             for task_key, versions in task_versions.items():
-                shot_id, task_id = task_key.split('_')
-
-                shot_name = versions[0]['entity']['name'] if versions and versions[0].get('entity') else f"ID: {shot_id}"
-                task_name = versions[0]['sg_task']['name'] if versions and versions[0].get('sg_task') else f"ID: {task_id}"
-                self.log_message(f"\nProcessing Shot: {shot_name}, Task: {task_name}")
-
-                # Ensure chronological order by created_at (already asc in query, but safeguard)
-                versions_sorted = sorted(versions, key=lambda v: v.get('created_at'))
+                shot_id, task_id = task_key
+
+                first = versions[0] if versions else {}
+                entity = first.get('entity')
+                task = first.get('sg_task')
+                shot_name = entity['name'] if entity else f"ID: {shot_id}"
+                task_name = task['name'] if task else f"ID: {task_id}"
+                log(f"\nProcessing Shot: {shot_name}, Task: {task_name}")
+
+                # All three rules in one newest-first pass: a version is a candidate once
+                # more than KEEP_NEWEST[status] newer versions with its status have been seen.
+                #   Rule 1: all "na" versions
+                #   Rule 2: "innote" versions older than the newest one
+                #   Rule 3: "note" versions older than the 2 newest
+                status_counts = dict.fromkeys(KEEP_NEWEST, 0)
+                # Groups come from group_versions_by_shot, already sorted by created_at
+                for v in reversed(versions):
+                    status = v.get('sg_status_list')
+                    keep = keep_newest(status)
+                    if keep is None:
+                        continue
+                    count = status_counts[status] + 1
+                    status_counts[status] = count
+                    if count <= keep:
+                        continue
 
-                # Rule 1: All EXR renders linked to versions with status "na"
-                na_versions = [v for v in versions_sorted if v.get('sg_status_list') == 'na']
-                for v in na_versions:
                     p = v.get('sg_path_to_frames')
                     if p:
-                        seq_dir = self.get_sequence_directory(p)
-                        if os.path.exists(seq_dir):
-                            paths_to_move.append(seq_dir)
-                            self.log_message(f"Rule 1 (na): {v.get('code')}  ->  {seq_dir}")
-                        else:
-                            missing_paths += 1
-
-                # Rule 2: For status "innote" on shots with >1, keep newest; move older
-                innote_versions = [v for v in versions_sorted if v.get('sg_status_list') == 'innote']
-                if len(innote_versions) > 1:
-                    older = innote_versions[:-1]  # keep the newest
-                    for v in older:
-                        p = v.get('sg_path_to_frames')
-                        if p:
-                            seq_dir = self.get_sequence_directory(p)
-                            if os.path.exists(seq_dir):
-                                paths_to_move.append(seq_dir)
-                                self.log_message(f"Rule 2 (older innote): {v.get('code')}  ->  {seq_dir}")
-                            else:
-                                missing_paths += 1
-
-                # Rule 3: For status "note" when >2 exist, keep 2 newest; move older
-                note_versions = [v for v in versions_sorted if v.get('sg_status_list') == 'note']
-                if len(note_versions) > 2:
-                    older = note_versions[:-2]  # keep 2 newest
-                    for v in older:
-                        p = v.get('sg_path_to_frames')
-                        if p:
-                            seq_dir = self.get_sequence_directory(p)
-                            if os.path.exists(seq_dir):
-                                paths_to_move.append(seq_dir)
-                                self.log_message(f"Rule 3 (older note): {v.get('code')}  ->  {seq_dir}")
-                            else:
-                                missing_paths += 1
-
-            if missing_paths > 0:
-                self.log_message(f"\nSkipped {missing_paths} paths that no longer exist on the file system")
+                        seq_dir = _seq_dir(p)
+                        if seq_dir not in seen:
+                            add_seen(seq_dir)
+                            add_path(seq_dir)
+                            log(f"{RULE_LABELS[status]}: {v.get('code')}  ->  {seq_dir}")
 
-            # De-duplicate while preserving order
-            seen = set()
-            deduped = []
-            for p in paths_to_move:
-                if p not in seen:
-                    seen.add(p)
-                    deduped.append(p)
-
-            return deduped
+            return paths_to_move
 
         except Exception as e:
             self.log_message(f"Error applying cleanup rules: {str(e)}")
@@ -502,19 +1047,28 @@ class RenderCleanup(object):
             return paths_to_move
 
     def log_message(self, message):
-        """Log a message to both the logger and the UI"""
+        """Log a message to the logger and queue it for the UI (safe from any thread)"""
         try:
             self.log.info(message)
-            if self.results_text:
-                self.results_text.append(message)
-                cursor = self.results_text.textCursor()
-                cursor.movePosition(QTextCursor.End)
-                self.results_text.setTextCursor(cursor)
-                QtWidgets.QApplication.processEvents()
+            if self.results_text is not None:
+                self._log_buffer.append(message)
         except Exception as e:
             self.log.error(f"Error in log_message: {str(e)}")
             self.log.info(message)
 
+    def _flush_log(self):
+        """Write all queued log messages to the preview box in one insert (QTimer slot)"""
+        try:
+            if not self._log_buffer or not self.results_text:
+                return
+            msgs = []
+            while self._log_buffer:
+                msgs.append(self._log_buffer.popleft())
+            self.results_text.moveCursor(QTextCursor.End)
+            self.results_text.insertPlainText("\n".join(msgs) + "\n")
+        except Exception as e:
+            self.log.error(f"Error flushing log: {str(e)}")
+
 def run_in_nuke():
     """Run the cleanup tool from Nuke with robust error handling"""
     try: